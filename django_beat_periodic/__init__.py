@@ -3,6 +3,6 @@
 __version__ = "0.5.0"
 
 from django_beat_periodic.decorators import periodic_task
-from django_beat_periodic.sync import sync_periodic_tasks
+from django_beat_periodic.sync import SyncStatus, sync_periodic_tasks
 
-__all__ = ["periodic_task", "sync_periodic_tasks"]
+__all__ = ["SyncStatus", "periodic_task", "sync_periodic_tasks"]
@@ -1,4 +1,6 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.db.backends.signals import connection_created
 
 
 class DjangoBeatPeriodicConfig(AppConfig):
@@ -7,6 +9,10 @@ class DjangoBeatPeriodicConfig(AppConfig):
     verbose_name = "Django Beat Periodic"
 
     def ready(self):
-        from django_beat_periodic.sync import sync_periodic_tasks
+        from django_beat_periodic.sync import _sync_on_first_connection
 
-        sync_periodic_tasks()
+        # Defer the sync until a database connection is actually opened so
+        # that ready() itself never queries the database and processes that
+        # never connect (e.g. collectstatic) skip it entirely.
+        if getattr(settings, "BEAT_PERIODIC_AUTO_SYNC", True):
+            connection_created.connect(_sync_on_first_connection, weak=False)
@@ -1,8 +1,87 @@
 from __future__ import annotations
 
+import json
+from datetime import timedelta
+from functools import lru_cache
+
 from celery import current_app
+from celery.schedules import ParseException, crontab_parser
+
+from django_beat_periodic.registry import (
+    CRONTAB_FIELDS,
+    PERIODIC_TASKS,
+    PeriodicTaskEntry,
+)
+
+def _dumps(value) -> str:
+    """Serialize *value* to compact JSON for ``PeriodicTask.args``/``kwargs``."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+# Celery parsers for each of ``CRONTAB_FIELDS``, as used by beat itself.
+_CRON_PARSERS = (
+    crontab_parser(60),
+    crontab_parser(24),
+    crontab_parser(31, 1),
+    crontab_parser(12, 1),
+    crontab_parser(7),
+)
+
+# Serialized defaults shared by every task without ``args``/``kwargs``.
+EMPTY_ARGS = _dumps([])
+EMPTY_KWARGS = _dumps({})
+
+
+@lru_cache(maxsize=256)
+def _parse_cron(expression: str, timezone: str | None) -> tuple:
+    """Split a 5-part cron string into a crontab schedule key.
+
+    The key is the ``CRONTAB_FIELDS`` values followed by *timezone* (or
+    ``None``).  Callers always pass *timezone* positionally so equal
+    expressions hit the same cache entry.  Each field is checked with Celery's own
+    crontab parser, so expressions that beat would reject fail at
+    decoration time.  Cached so tasks sharing an expression share one
+    parsed tuple.
+
+    Raises:
+        ValueError: If the expression does not have exactly 5 valid fields.
+    """
+    parts = expression.split()
+    if len(parts) != len(CRONTAB_FIELDS):
+        raise ValueError(
+            f"Invalid crontab {expression!r}: expected 5 space-separated fields"
+        )
+    for field, part, parser in zip(CRONTAB_FIELDS, parts, _CRON_PARSERS):
+        try:
+            parser.parse(part)
+        except (ParseException, ValueError) as exc:
+            raise ValueError(
+                f"Invalid crontab {expression!r}: bad {field} {part!r} ({exc})"
+            ) from exc
+    return (*parts, timezone)
 
-from django_beat_periodic.registry import PERIODIC_TASKS
+
+def _parse_crontab(crontab: str | dict) -> tuple:
+    """Normalize a crontab string or dict into a crontab schedule key.
+
+    Cron fields missing from a dict default to ``"*"``; an optional
+    ``timezone`` entry is carried through to the schedule.
+
+    Raises:
+        ValueError: If the crontab cannot be normalized.
+    """
+    if isinstance(crontab, str):
+        return _parse_cron(crontab, None)
+    if isinstance(crontab, dict) and set(crontab) <= {*CRONTAB_FIELDS, "timezone"}:
+        timezone = crontab.get("timezone")
+        return _parse_cron(
+            " ".join(str(crontab.get(field, "*")) for field in CRONTAB_FIELDS),
+            str(timezone) if timezone is not None else None,
+        )
+    raise ValueError(
+        f"Invalid crontab {crontab!r}: expected a 5-part cron string "
+        f"or a dict of {', '.join(CRONTAB_FIELDS)} and timezone"
+    )
 
 
 def periodic_task(
@@ -17,29 +96,52 @@ def periodic_task(
     schedule metadata is stored in :data:`PERIODIC_TASKS` so that
     :func:`~django_beat_periodic.sync.sync_periodic_tasks` can
     create the corresponding ``django_celery_beat`` database rows at
-    startup time.
+    startup time.  The schedule and task arguments are normalized here,
+    once, so the sync only reads precomputed values.
 
     Args:
         interval: Run frequency.  Either an ``int`` (seconds) or a
             :class:`~datetime.timedelta`.
         crontab: Cron expression as a 5-part string (``"*/5 * * * *"``)
             or a ``dict`` of :class:`~django_celery_beat.models.CrontabSchedule`
-            field values.
+            fields: the cron fields (missing ones default to ``"*"``) and
+            an optional ``timezone``.
         enabled: Whether the periodic task should be enabled (default ``True``).
         **kwargs: Extra fields forwarded to
             :class:`~django_celery_beat.models.PeriodicTask` (e.g. ``name``,
             ``queue``, ``priority``, ``args``, ``kwargs``).
+
+    Raises:
+        ValueError: If ``crontab`` is malformed, or if both ``expires`` and
+            ``expire_seconds`` are given.
     """
+    if kwargs.get("expires") and kwargs.get("expire_seconds") is not None:
+        raise ValueError("Only one of expires and expire_seconds can be set.")
+    if isinstance(interval, int):
+        interval = timedelta(seconds=interval)
+    if crontab is not None:
+        crontab = _parse_crontab(crontab)
 
     def decorator(func):
+        task_path = f"{func.__module__}.{func.__name__}"
+        extras = dict(kwargs)
+        task_args = extras.pop("args", None)
+        task_kwargs = extras.pop("kwargs", None)
         PERIODIC_TASKS.append(
-            {
-                "func": func,
-                "interval": interval,
-                "crontab": crontab,
-                "enabled": enabled,
-                "kwargs": kwargs,
-            }
+            PeriodicTaskEntry(
+                func=func,
+                task_path=task_path,
+                name=extras.pop("name", task_path),
+                interval=interval,
+                crontab=crontab,
+                enabled=enabled,
+                args_json=_dumps(task_args) if task_args else EMPTY_ARGS,
+                kwargs_json=_dumps(task_kwargs) if task_kwargs else EMPTY_KWARGS,
+                queue=extras.pop("queue", None),
+                priority=extras.pop("priority", None),
+                start_time=extras.pop("start_time", None),
+                extras=extras,
+            )
         )
         # Wrap with the standard Celery task decorator using the
         # project's current Celery application.
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from django_beat_periodic.sync import SyncStatus, sync_periodic_tasks
+
+
+class Command(BaseCommand):
+    help = "Synchronise @periodic_task decorators with django-celery-beat."
+
+    def handle(self, *args, **options):
+        status = sync_periodic_tasks()
+        if status is SyncStatus.TABLES_MISSING:
+            raise CommandError(
+                "django_celery_beat tables do not exist — run migrate first."
+            )
+        if status is SyncStatus.LOCKED:
+            self.stdout.write(
+                self.style.WARNING(
+                    "Another process is synchronizing periodic tasks — skipped."
+                )
+            )
+            return
+        self.stdout.write(self.style.SUCCESS("Periodic tasks are synchronized."))
@@ -5,4 +5,52 @@ Each entry is collected by the ``@periodic_task`` decorator and later
 consumed by :func:`django_beat_periodic.sync.sync_periodic_tasks`.
 """
 
-PERIODIC_TASKS: list[dict] = []
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+# CrontabSchedule fields, in the order used by 5-part cron strings.
+CRONTAB_FIELDS = ("minute", "hour", "day_of_month", "month_of_year", "day_of_week")
+
+
+@dataclass(frozen=True)
+class PeriodicTaskEntry:
+    """Normalized schedule metadata for one decorated function.
+
+    ``__slots__`` is spelled out (rather than ``slots=True``) to keep
+    Python 3.9 support.
+    """
+
+    __slots__ = (
+        "func",
+        "task_path",
+        "name",
+        "interval",
+        "crontab",
+        "enabled",
+        "args_json",
+        "kwargs_json",
+        "queue",
+        "priority",
+        "start_time",
+        "extras",
+    )
+
+    func: Callable
+    task_path: str
+    name: str
+    interval: timedelta | None
+    # CRONTAB_FIELDS values followed by the timezone (or None).
+    crontab: tuple[str | None, ...] | None
+    enabled: bool
+    args_json: str
+    kwargs_json: str
+    queue: str | None
+    priority: int | None
+    start_time: datetime | None
+    extras: dict[str, Any]
+
+
+PERIODIC_TASKS: list[PeriodicTaskEntry] = []
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
-import json
 import logging
-from datetime import timedelta
+import os
+import tempfile
+import threading
+import zlib
+from contextlib import contextmanager
+from enum import Enum
 
+from django.db import connections, router, transaction
+from django.db.backends.signals import connection_created
+from django.db.models import Q
 from django.utils import timezone
 
-from django_beat_periodic.registry import PERIODIC_TASKS
+from django_beat_periodic.registry import (
+    CRONTAB_FIELDS,
+    PERIODIC_TASKS,
+    PeriodicTaskEntry,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
 
 logger = logging.getLogger("django_beat_periodic")
 
@@ -15,11 +31,43 @@ logger = logging.getLogger("django_beat_periodic")
 # corresponding @periodic_task decorator is removed from the code.
 MANAGED_DESCRIPTION = "Managed by django-beat-periodic"
 
+# PeriodicTask fields written by the sync, loaded when diffing existing rows.
+SYNCED_FIELDS = (
+    "name",
+    "task",
+    "enabled",
+    "description",
+    "args",
+    "kwargs",
+    "queue",
+    "priority",
+    "start_time",
+    "interval",
+    "crontab",
+    "solar",
+    "clocked",
+)
+
+# Key of the PostgreSQL advisory lock held while syncing.
+SYNC_LOCK_ID = zlib.crc32(b"django-beat-periodic-sync")
+
+
+
+class SyncStatus(str, Enum):
+    """Outcome of :func:`sync_periodic_tasks`."""
+
+    SYNCED = "synced"
+    ALREADY_SYNCED = "already_synced"
+    TABLES_MISSING = "tables_missing"
+    LOCKED = "locked"
+
+
 # Guard against duplicate syncs in dev (auto-reload runs ready() twice).
 _already_synced = False
+_thread_lock = threading.Lock()
 
 
-def sync_periodic_tasks() -> None:
+def sync_periodic_tasks() -> SyncStatus:
     """Synchronise decorator-registered periodic tasks with the database.
 
     For every entry in :data:`~django_beat_periodic.registry.PERIODIC_TASKS`
@@ -28,158 +76,413 @@ def sync_periodic_tasks() -> None:
     :class:`~django_celery_beat.models.IntervalSchedule` or
     :class:`~django_celery_beat.models.CrontabSchedule`).
 
+    Existing rows are fetched with a single query and diffed in memory, so
+    the number of queries does not grow with the number of tasks.
+
     The function is idempotent: it skips DB writes when nothing changed and
     only calls ``PeriodicTasks.update_changed()`` when at least one row was
     created or modified.
+
+    Returns:
+        :attr:`SyncStatus.SYNCED` once the database matches the registry,
+        :attr:`SyncStatus.ALREADY_SYNCED` if an earlier call in this process
+        did so, :attr:`SyncStatus.TABLES_MISSING` if django_celery_beat is
+        not migrated yet, or :attr:`SyncStatus.LOCKED` if another process
+        holds the sync lock.
     """
     global _already_synced
+
+    # Opening the first connection below fires ``connection_created``; drop
+    # the startup receiver first so it cannot re-enter this function while
+    # ``_thread_lock`` is held.
+    connection_created.disconnect(_sync_on_first_connection)
+
     if _already_synced:
+        return SyncStatus.ALREADY_SYNCED
+
+    from django_celery_beat.models import PeriodicTask
+
+    # Double-checked so concurrent threads (threaded runserver, ASGI) run the
+    # sync once.  The flag is only set once the sync has finished, so a
+    # failed or skipped sync is retried on the next call.
+    with _thread_lock:
+        if _already_synced:
+            return SyncStatus.ALREADY_SYNCED
+
+        using = router.db_for_write(PeriodicTask)
+
+        # The tables may not exist yet (before first migration or during test
+        # collection).  Silently skip in that case.  Introspection only reads
+        # the catalog, unlike a COUNT(*) on the table itself.
+        try:
+            table_names = connections[using].introspection.table_names()
+        except Exception:
+            table_names = []
+        if PeriodicTask._meta.db_table not in table_names:
+            logger.debug(
+                "django_celery_beat tables do not exist yet — skipping sync."
+            )
+            return SyncStatus.TABLES_MISSING
+
+        # Nothing registered and nothing left to clean up.
+        if (
+            not PERIODIC_TASKS
+            and not PeriodicTask.objects.using(using)
+            .filter(description=MANAGED_DESCRIPTION)
+            .exists()
+        ):
+            _already_synced = True
+            logger.debug("No periodic tasks registered — skipping sync.")
+            return SyncStatus.SYNCED
+
+        with _sync_lock(connections[using]) as acquired:
+            if not acquired:
+                _already_synced = True
+                logger.info(
+                    "Another process is synchronizing periodic tasks — skipping."
+                )
+                return SyncStatus.LOCKED
+
+            logger.info("Synchronizing periodic tasks with the database...")
+            with transaction.atomic(using=using):
+                synced_count, changed_count = _sync_tasks(using)
+            _already_synced = True
+
+    if changed_count > 0:
+        logger.info(
+            "Successfully synchronized %d periodic task(s) (%d changed).",
+            synced_count,
+            changed_count,
+        )
+    else:
+        logger.info("All periodic tasks are up-to-date.")
+    return SyncStatus.SYNCED
+
+
+def _sync_on_first_connection(sender, connection, **kwargs):
+    """Start the sync once, when the periodic-task database is first opened.
+
+    The sync runs on a background thread with its own connection, so the
+    code that happened to open this connection (usually the first request)
+    neither waits for it nor sees its errors.
+    """
+    from django_celery_beat.models import PeriodicTask
+
+    if connection.alias != router.db_for_write(PeriodicTask):
         return
-    _already_synced = True
+    connection_created.disconnect(_sync_on_first_connection)
+    threading.Thread(
+        target=_sync_in_background, name="django-beat-periodic-sync", daemon=True
+    ).start()
 
-    from django_celery_beat.models import (
-        CrontabSchedule,
-        IntervalSchedule,
-        PeriodicTask,
-        PeriodicTasks,
-    )
 
-    # The tables may not exist yet (before first migration or during test
-    # collection).  Silently skip in that case.
+def _sync_in_background() -> None:
     try:
-        PeriodicTask.objects.count()
+        sync_periodic_tasks()
     except Exception:
-        _already_synced = False
-        logger.debug("django_celery_beat tables do not exist yet — skipping sync.")
-        return
+        logger.exception("Failed to synchronize periodic tasks.")
+    finally:
+        connections.close_all()
 
-    logger.info("Synchronizing periodic tasks with the database...")
+
+def _sync_tasks(using: str) -> tuple[int, int]:
+    """Write the registered tasks to the *using* database.
+
+    Must run inside a transaction.  Returns the number of registered tasks
+    and the number of rows created, updated or deleted.
+    """
+    from django_celery_beat.models import PeriodicTask, PeriodicTasks
 
     active_task_names: list[str] = []
     changed_count = 0
 
-    for task_info in PERIODIC_TASKS:
-        func = task_info["func"]
-        interval = task_info["interval"]
-        crontab = task_info["crontab"]
-        enabled = task_info["enabled"]
-        kwargs = task_info["kwargs"].copy()
+    # ----------------------------------------------------------
+    # Collect the distinct schedules up front so they can be
+    # resolved with a constant number of queries.
+    # ----------------------------------------------------------
+    scheduled: list[PeriodicTaskEntry] = []
+    interval_keys: set[int] = set()
+    crontab_keys: set[tuple] = set()
+
+    for entry in PERIODIC_TASKS:
+        active_task_names.append(entry.name)
+
+        if entry.interval:
+            interval_keys.add(int(entry.interval.total_seconds()))
+        elif entry.crontab:
+            crontab_keys.add(entry.crontab)
+        else:
+            logger.warning(
+                "Task %s has no schedule defined — skipping.",
+                entry.task_path,
+            )
+            continue
+
+        scheduled.append(entry)
+
+    interval_schedules = _get_interval_schedules(interval_keys, using)
+    crontab_schedules = _get_crontab_schedules(crontab_keys, using)
+
+    # ----------------------------------------------------------
+    # Fetch every managed or same-named row in one query
+    # ----------------------------------------------------------
+    # Extra decorator kwargs are PeriodicTask fields too; load them up front
+    # so diffing them does not trigger deferred-field queries.
+    extra_fields = {field for entry in scheduled for field in entry.extras}
+    existing = {
+        obj.name: obj
+        for obj in PeriodicTask.objects.using(using).filter(
+            Q(description=MANAGED_DESCRIPTION) | Q(name__in=active_task_names)
+        ).only(*SYNCED_FIELDS, *extra_fields)
+    }
+    # Keyed by name so a duplicated name is written once (last definition wins).
+    to_create: dict = {}
+    # ``{name: (obj, {field: new_value})}`` of rows that differ from the code.
+    to_update: dict = {}
+
+    # Tasks without an explicit start_time all start from the same instant.
+    now = timezone.now()
 
-        task_path = f"{func.__module__}.{func.__name__}"
-        task_name = kwargs.pop("name", task_path)
-        active_task_names.append(task_name)
+    for entry in scheduled:
+        task_name = entry.name
 
         # ----------------------------------------------------------
         # Build the schedule
         # ----------------------------------------------------------
+        # Set and compare the foreign keys by id so diffing an existing row
+        # never lazy-loads its related schedule.
         schedule_kwargs: dict = {
-            "interval": None,
-            "crontab": None,
-            "solar": None,
-            "clocked": None,
+            "interval_id": None,
+            "crontab_id": None,
+            "solar_id": None,
+            "clocked_id": None,
         }
-
-        if interval is not None:
-            if isinstance(interval, int):
-                interval = timedelta(seconds=interval)
-            schedule, _ = IntervalSchedule.objects.get_or_create(
-                every=int(interval.total_seconds()),
-                period=IntervalSchedule.SECONDS,
-            )
-            schedule_kwargs["interval"] = schedule
-
-        elif crontab is not None:
-            if isinstance(crontab, str):
-                parts = crontab.split()
-                if len(parts) == 5:
-                    schedule, _ = CrontabSchedule.objects.get_or_create(
-                        minute=parts[0],
-                        hour=parts[1],
-                        day_of_month=parts[2],
-                        month_of_year=parts[3],
-                        day_of_week=parts[4],
-                    )
-                    schedule_kwargs["crontab"] = schedule
-                else:
-                    logger.warning(
-                        "Invalid crontab string for %s: '%s' "
-                        "(expected 5 space-separated fields)",
-                        task_path,
-                        crontab,
-                    )
-                    continue
-            elif isinstance(crontab, dict):
-                schedule, _ = CrontabSchedule.objects.get_or_create(**crontab)
-                schedule_kwargs["crontab"] = schedule
-
-        if not (interval or crontab):
-            logger.warning("Task %s has no schedule defined — skipping.", task_path)
-            continue
+        if entry.interval:
+            every = int(entry.interval.total_seconds())
+            schedule_kwargs["interval_id"] = interval_schedules[every].pk
+        else:
+            schedule_kwargs["crontab_id"] = crontab_schedules[entry.crontab].pk
 
         # ----------------------------------------------------------
         # Build the PeriodicTask defaults
         # ----------------------------------------------------------
-        # Get start_time from kwargs or default to now
-        start_time = kwargs.pop("start_time", timezone.now())
-
         defaults = {
-            "task": task_path,
-            "enabled": enabled,
+            "task": entry.task_path,
+            "enabled": entry.enabled,
             "description": MANAGED_DESCRIPTION,
-            "args": json.dumps(kwargs.pop("args", [])),
-            "kwargs": json.dumps(kwargs.pop("kwargs", {})),
-            "queue": kwargs.pop("queue", None),
-            "priority": kwargs.pop("priority", None),
-            "start_time": start_time,
+            "args": entry.args_json,
+            "kwargs": entry.kwargs_json,
+            "queue": entry.queue,
+            "priority": entry.priority,
+            "start_time": entry.start_time or now,
             **schedule_kwargs,
-            **kwargs,
+            **entry.extras,
         }
+        # Mirror PeriodicTask.save(), which the bulk writes below bypass:
+        # empty routing options and headers are stored as NULL.
+        for key in ("queue", "exchange", "routing_key", "headers"):
+            if key in defaults:
+                defaults[key] = defaults[key] or None
 
         # ----------------------------------------------------------
-        # Create or update
+        # Diff against the prefetched row
         # ----------------------------------------------------------
-        obj, created = PeriodicTask.objects.get_or_create(
-            name=task_name, defaults=defaults
-        )
-        if not created:
-            needs_update = False
-            for key, value in defaults.items():
-                # Avoid resetting start_time if it's already set to a non-null value
-                if key == "start_time" and obj.start_time is not None:
-                    continue
-                if getattr(obj, key) != value:
-                    setattr(obj, key, value)
-                    needs_update = True
-            if needs_update:
-                obj.save()
-                changed_count += 1
+        obj = existing.get(task_name)
+        if obj is None:
+            to_create[task_name] = PeriodicTask(name=task_name, **defaults)
+            continue
+
+        # Avoid resetting start_time if it's already set to a non-null value
+        if obj.start_time is not None:
+            defaults["start_time"] = obj.start_time
+
+        changed = {
+            key: value for key, value in defaults.items() if getattr(obj, key) != value
+        }
+        if not changed:
+            continue
+        # Disabling a task clears its last run, as PeriodicTask.save() does.
+        if changed.get("enabled") is False:
+            changed["last_run_at"] = None
+        for key, value in changed.items():
+            setattr(obj, key, value)
+        to_update.setdefault(task_name, (obj, {}))[1].update(changed)
+
+    # ----------------------------------------------------------
+    # Create or update in bulk
+    # ----------------------------------------------------------
+    if to_create:
+        PeriodicTask.objects.using(using).bulk_create(list(to_create.values()))
+    # Only write the fields that actually differ: rows sharing the same set
+    # of changed fields are bulk-updated together, a lone row gets a plain
+    # UPDATE of just those columns.
+    by_fields: dict[tuple[str, ...], list] = {}
+    for obj, changed in to_update.values():
+        by_fields.setdefault(tuple(sorted(changed)), []).append(obj)
+    for fields, objs in by_fields.items():
+        if len(objs) == 1:
+            obj = objs[0]
+            PeriodicTask.objects.using(using).filter(pk=obj.pk).update(
+                **{field: getattr(obj, field) for field in fields}
+            )
         else:
-            changed_count += 1
+            PeriodicTask.objects.using(using).bulk_update(objs, fields)
+    changed_count += len(to_create) + len(to_update)
 
     # ----------------------------------------------------------
     # Remove stale tasks (decorator removed from code)
     # ----------------------------------------------------------
-    stale_tasks = PeriodicTask.objects.filter(
-        description=MANAGED_DESCRIPTION,
-    ).exclude(name__in=active_task_names)
-
-    stale_count = stale_tasks.count()
-    if stale_count > 0:
-        stale_names = list(stale_tasks.values_list("name", flat=True))
-        stale_tasks.delete()
+    # Every managed row was already loaded above, so the stale ones are
+    # found in memory and deleted by primary key.
+    active = set(active_task_names)
+    stale_pks = {
+        name: obj.pk
+        for name, obj in existing.items()
+        if name not in active and obj.description == MANAGED_DESCRIPTION
+    }
+    if stale_pks:
+        # delete() loads the rows to send signals; only hydrate the key and name.
+        _, deleted = (
+            PeriodicTask.objects.using(using).filter(pk__in=stale_pks.values())
+            .only("id", "name")
+            .delete()
+        )
+        stale_count = deleted.get(PeriodicTask._meta.label, 0)
         changed_count += stale_count
         logger.info(
             "Removed %d stale periodic task(s): %s",
             stale_count,
-            stale_names,
+            sorted(stale_pks),
         )
 
     if changed_count > 0:
-        PeriodicTasks.update_changed()
-        logger.info(
-            "Successfully synchronized %d periodic task(s) (%d changed).",
-            len(active_task_names),
-            changed_count,
+        # Notify the beat scheduler only once the changes are durable.
+        transaction.on_commit(PeriodicTasks.update_changed, using=using)
+
+    return len(active_task_names), changed_count
+
+
+@contextmanager
+def _sync_lock(connection):
+    """Hold a cross-process lock while syncing; yields whether it was acquired.
+
+    Under gunicorn/uwsgi every worker runs ``ready()`` at the same time, so
+    only the worker holding the lock syncs and the others skip.  PostgreSQL
+    uses a session-level advisory lock; other backends fall back to an
+    exclusive ``flock`` on a file in the temp directory (no lock where
+    ``fcntl`` is unavailable).
+    """
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", [SYNC_LOCK_ID])
+            acquired = cursor.fetchone()[0]
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT pg_advisory_unlock(%s)", [SYNC_LOCK_ID])
+        return
+
+    if fcntl is None:  # pragma: no cover - Windows
+        yield True
+        return
+
+    # One lock file per database so unrelated projects do not block each other.
+    database = str(connection.settings_dict["NAME"])
+    lock_path = os.path.join(
+        tempfile.gettempdir(),
+        f"django-beat-periodic-{zlib.crc32(database.encode()):08x}.lock",
+    )
+    with open(lock_path, "w") as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _get_interval_schedules(keys: set[int], using: str) -> dict:
+    """Return ``{every: IntervalSchedule}`` for every key, creating missing rows.
+
+    Uses one SELECT, at most one bulk INSERT and one re-SELECT regardless of
+    the number of keys.
+    """
+    from django_celery_beat.models import IntervalSchedule
+
+    if not keys:
+        return {}
+
+    def fetch() -> dict:
+        schedules = {}
+        for schedule in IntervalSchedule.objects.using(using).filter(
+            period=IntervalSchedule.SECONDS, every__in=keys
+        ).order_by("pk"):
+            schedules.setdefault(schedule.every, schedule)
+        return schedules
+
+    schedules = fetch()
+    missing = keys - schedules.keys()
+    if missing:
+        IntervalSchedule.objects.using(using).bulk_create(
+            [
+                IntervalSchedule(every=every, period=IntervalSchedule.SECONDS)
+                for every in missing
+            ],
+            ignore_conflicts=True,
         )
-    else:
-        logger.info("All periodic tasks are up-to-date.")
+        schedules = fetch()
+    return schedules
+
+
+def _crontab_schedule_fields(key: tuple) -> dict:
+    """Return the ``CrontabSchedule`` field values for a crontab key."""
+    *cron, timezone = key
+    fields = dict(zip(CRONTAB_FIELDS, cron))
+    if timezone is not None:
+        fields["timezone"] = timezone
+    return fields
+
+
+def _get_crontab_schedules(keys: set[tuple], using: str) -> dict:
+    """Return ``{crontab_key: CrontabSchedule}`` for every key, creating missing rows.
+
+    A key without a timezone maps to a schedule in the model's default
+    timezone.  Uses one SELECT, at most one bulk INSERT and one re-SELECT
+    regardless of the number of keys.
+    """
+    from django_celery_beat.models import CrontabSchedule
+
+    if not keys:
+        return {}
+
+    default_timezone = str(CrontabSchedule._meta.get_field("timezone").get_default())
+
+    def fetch() -> dict:
+        query = Q()
+        for key in keys:
+            query |= Q(**_crontab_schedule_fields(key))
+        schedules = {}
+        for schedule in (
+            CrontabSchedule.objects.using(using).filter(query).order_by("pk")
+        ):
+            cron = tuple(getattr(schedule, field) for field in CRONTAB_FIELDS)
+            timezone = str(schedule.timezone)
+            schedules.setdefault((*cron, timezone), schedule)
+            if timezone == default_timezone:
+                schedules.setdefault((*cron, None), schedule)
+        return schedules
+
+    schedules = fetch()
+    missing = keys - schedules.keys()
+    if missing:
+        CrontabSchedule.objects.using(using).bulk_create(
+            [CrontabSchedule(**_crontab_schedule_fields(key)) for key in missing],
+            ignore_conflicts=True,
+        )
+        schedules = fetch()
+    return schedules
@@ -16,6 +16,10 @@ INSTALLED_APPS = [
 
 USE_TZ = True
 
+# Tests call sync_periodic_tasks() explicitly; the background startup sync
+# is covered with tests.settings_autosync.
+BEAT_PERIODIC_AUTO_SYNC = False
+
 CELERY_BROKER_URL = "memory://"
 CELERY_RESULT_BACKEND = "cache+memory://"
 
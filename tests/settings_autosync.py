@@ -0,0 +1,5 @@
+"""Test settings with the automatic startup sync enabled."""
+
+from tests.settings import *  # noqa: F401,F403
+
+BEAT_PERIODIC_AUTO_SYNC = True
@@ -0,0 +1,70 @@
+"""Tests for the startup sync wired up in DjangoBeatPeriodicConfig.ready()."""
+
+import threading
+
+import pytest
+from django.apps import apps
+from django.db import connection
+from django.db.backends.signals import connection_created
+
+import django_beat_periodic.sync as sync_mod
+from django_beat_periodic.sync import _sync_on_first_connection
+
+
+def _ready():
+    apps.get_app_config("django_beat_periodic").ready()
+
+
+def _open_connection():
+    connection_created.send(sender=type(connection), connection=connection)
+
+
+def _join_sync_threads():
+    for thread in threading.enumerate():
+        if thread.name == "django-beat-periodic-sync":
+            thread.join(timeout=10)
+
+
+class TestAutoSync:
+    @pytest.fixture(autouse=True)
+    def _cleanup(self):
+        yield
+        _join_sync_threads()
+        connection_created.disconnect(_sync_on_first_connection)
+
+    def test_setting_disables_startup_sync(self, settings):
+        settings.BEAT_PERIODIC_AUTO_SYNC = False
+        _ready()
+
+        assert not connection_created.disconnect(_sync_on_first_connection)
+
+    def test_syncs_once_in_background(self, settings, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            sync_mod,
+            "sync_periodic_tasks",
+            lambda: calls.append(threading.current_thread()),
+        )
+        settings.BEAT_PERIODIC_AUTO_SYNC = True
+        _ready()
+
+        _open_connection()
+        _open_connection()
+        _join_sync_threads()
+
+        assert len(calls) == 1
+        assert calls[0] is not threading.current_thread()
+
+    def test_errors_are_logged_not_raised(self, settings, monkeypatch, caplog):
+        def failing_sync():
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(sync_mod, "sync_periodic_tasks", failing_sync)
+        settings.BEAT_PERIODIC_AUTO_SYNC = True
+        _ready()
+
+        _open_connection()
+        _join_sync_threads()
+
+        assert "Failed to synchronize periodic tasks." in caplog.text
+        assert "boom" in caplog.text
@@ -1,6 +1,10 @@
 """Tests for the @periodic_task decorator and sync_periodic_tasks()."""
 
+import os
+import subprocess
+import sys
 from datetime import timedelta
+from io import StringIO
 
 import pytest
 
@@ -69,32 +73,108 @@ class TestPeriodicTaskDecorator:
 
     def test_interval_int_is_stored(self):
         entry = PERIODIC_TASKS[0]
-        assert entry["interval"] == 30
-        assert entry["crontab"] is None
-        assert entry["enabled"] is True
+        assert entry.interval == timedelta(seconds=30)
+        assert entry.crontab is None
+        assert entry.enabled is True
 
     def test_interval_timedelta_is_stored(self):
         entry = PERIODIC_TASKS[1]
-        assert entry["interval"] == timedelta(minutes=5)
+        assert entry.interval == timedelta(minutes=5)
 
     def test_crontab_str_is_stored(self):
         entry = PERIODIC_TASKS[2]
-        assert entry["crontab"] == "0 */2 * * *"
-        assert entry["interval"] is None
+        assert entry.crontab == ("0", "*/2", "*", "*", "*", None)
+        assert entry.interval is None
 
     def test_crontab_dict_is_stored(self):
         entry = PERIODIC_TASKS[3]
-        assert entry["crontab"] == {
-            "minute": "0",
-            "hour": "3",
-            "day_of_week": "monday",
-        }
+        assert entry.crontab == ("0", "3", "*", "*", "monday", None)
+
+    def test_crontab_dict_timezone_is_stored(self):
+        from django_beat_periodic.decorators import periodic_task
+
+        @periodic_task(
+            crontab={"minute": "0", "hour": "9", "timezone": "Europe/Berlin"}
+        )
+        def berlin_morning():
+            return "guten morgen"
+
+        entry = PERIODIC_TASKS[-1]
+        assert entry.crontab == ("0", "9", "*", "*", "*", "Europe/Berlin")
 
     def test_disabled_and_extra_kwargs(self):
         entry = PERIODIC_TASKS[4]
-        assert entry["enabled"] is False
-        assert entry["kwargs"]["name"] == "custom-task-name"
-        assert entry["kwargs"]["queue"] == "low"
+        assert entry.enabled is False
+        assert entry.name == "custom-task-name"
+        assert entry.queue == "low"
+        assert entry.extras == {}
+
+    def test_task_path_and_arguments_are_precomputed(self):
+        entry = PERIODIC_TASKS[0]
+        assert entry.task_path == f"{__name__}.every_30_seconds"
+        assert entry.name == entry.task_path
+        assert entry.args_json == "[]"
+        assert entry.kwargs_json == "{}"
+
+    def test_args_and_kwargs_are_serialized(self):
+        from django_beat_periodic.decorators import periodic_task
+
+        @periodic_task(interval=30, args=[1, "a"], kwargs={"b": 2})
+        def with_arguments(n, s, b):
+            return n
+
+        entry = PERIODIC_TASKS[-1]
+        assert entry.args_json == '[1,"a"]'
+        assert entry.kwargs_json == '{"b":2}'
+
+    def test_dumps_uses_stdlib_json_compactly(self):
+        from datetime import date
+
+        from django_beat_periodic.decorators import _dumps
+
+        assert _dumps({1: "a"}) == '{"1":"a"}'
+        assert _dumps([1e16, 1e-7, "é"]) == '[1e+16,1e-07,"é"]'
+        assert _dumps([float("nan"), float("inf")]) == "[NaN,Infinity]"
+        with pytest.raises(TypeError):
+            _dumps({"d": date(2024, 1, 1)})
+
+    def test_shared_crontab_is_parsed_once(self):
+        from django_beat_periodic.decorators import _parse_crontab
+
+        parsed = PERIODIC_TASKS[2].crontab
+        assert _parse_crontab("0 */2 * * *") is parsed
+        assert _parse_crontab({"minute": "0", "hour": "*/2"}) is parsed
+
+    @pytest.mark.parametrize(
+        "crontab",
+        [
+            "0 */2 * *",
+            "0 */2 * * * *",
+            "61 * * * *",
+            "* 24 * * *",
+            "* * * * funday",
+            {"minute": "0", "second": "0"},
+            {"day_of_month": "0"},
+        ],
+    )
+    def test_invalid_crontab_raises(self, crontab):
+        from django_beat_periodic.decorators import periodic_task
+
+        with pytest.raises(ValueError, match="Invalid crontab"):
+            periodic_task(crontab=crontab)
+
+    def test_expires_and_expire_seconds_are_exclusive(self):
+        from datetime import datetime, timezone
+
+        from django_beat_periodic.decorators import periodic_task
+
+        with pytest.raises(ValueError, match="expire_seconds"):
+            periodic_task(
+                interval=10,
+                expires=datetime(2030, 1, 1, tzinfo=timezone.utc),
+                expire_seconds=60,
+            )
+        assert len(PERIODIC_TASKS) == 5
 
 
 # ------------------------------------------------------------------ #
@@ -144,6 +224,31 @@ class TestSyncPeriodicTasks:
         # "0 */2 * * *" and the dict-based monday 3am → 2 crontabs
         assert CrontabSchedule.objects.count() == 2
 
+    def test_crontab_timezone_is_synced(self):
+        """A crontab dict's timezone should end up on its schedule."""
+        from django_celery_beat.models import CrontabSchedule, PeriodicTask
+
+        from django_beat_periodic.decorators import periodic_task
+        from django_beat_periodic.sync import sync_periodic_tasks
+
+        @periodic_task(
+            crontab={"minute": "0", "hour": "*/2", "timezone": "Europe/Berlin"},
+            name="berlin-cron",
+        )
+        def berlin_every_two_hours():
+            return "cron"
+
+        sync_periodic_tasks()
+
+        # Same cron fields as every_two_hours_cron, but a separate schedule.
+        assert CrontabSchedule.objects.count() == 3
+        schedule = PeriodicTask.objects.get(name="berlin-cron").crontab
+        assert str(schedule.timezone) == "Europe/Berlin"
+        default = PeriodicTask.objects.get(
+            name=f"{__name__}.every_two_hours_cron"
+        ).crontab
+        assert default != schedule
+
     def test_custom_name_and_queue(self):
         from django_celery_beat.models import PeriodicTask
 
@@ -195,6 +300,82 @@ class TestSyncPeriodicTasks:
         pt.refresh_from_db()
         assert pt.enabled is False
 
+    def test_disabling_a_task_clears_last_run_at(self):
+        """Flipping enabled to False should reset last_run_at like save()."""
+        import django_beat_periodic.sync as sync_mod
+
+        from django.utils import timezone
+        from django_celery_beat.models import PeriodicTask
+
+        from django_beat_periodic.decorators import periodic_task
+        from django_beat_periodic.sync import sync_periodic_tasks
+
+        sync_periodic_tasks()
+        name = f"{__name__}.every_30_seconds"
+        PeriodicTask.objects.filter(name=name).update(last_run_at=timezone.now())
+
+        PERIODIC_TASKS.clear()
+
+        @periodic_task(interval=30, enabled=False)
+        def every_30_seconds():
+            return "tick"
+
+        sync_mod._already_synced = False
+        sync_periodic_tasks()
+
+        pt = PeriodicTask.objects.get(name=name)
+        assert pt.enabled is False
+        assert pt.last_run_at is None
+
+    def test_empty_queue_is_stored_as_null(self):
+        from django_celery_beat.models import PeriodicTask
+
+        from django_beat_periodic.decorators import periodic_task
+        from django_beat_periodic.sync import sync_periodic_tasks
+
+        @periodic_task(interval=45, name="empty-queue", queue="")
+        def empty_queue():
+            return "q"
+
+        sync_periodic_tasks()
+
+        assert PeriodicTask.objects.get(name="empty-queue").queue is None
+
+    def test_empty_headers_are_stored_as_null(self):
+        from django_celery_beat.models import PeriodicTask
+
+        from django_beat_periodic.decorators import periodic_task
+        from django_beat_periodic.sync import sync_periodic_tasks
+
+        @periodic_task(interval=45, name="empty-headers", headers="")
+        def empty_headers():
+            return "h"
+
+        sync_periodic_tasks()
+
+        assert PeriodicTask.objects.get(name="empty-headers").headers is None
+
+    def test_update_restores_several_rows(self):
+        """Rows drifting in the same fields should all be restored."""
+        import django_beat_periodic.sync as sync_mod
+
+        from django_celery_beat.models import PeriodicTask
+
+        from django_beat_periodic.sync import sync_periodic_tasks
+
+        sync_periodic_tasks()
+
+        PeriodicTask.objects.update(enabled=False, queue="manual")
+
+        sync_mod._already_synced = False
+        sync_periodic_tasks()
+
+        assert PeriodicTask.objects.filter(enabled=True).count() == 4
+        assert set(PeriodicTask.objects.values_list("queue", flat=True)) == {
+            None,
+            "low",
+        }
+
     def test_stale_tasks_are_deleted(self):
         """Tasks removed from code should be deleted from the DB on next sync."""
         import django_beat_periodic.sync as sync_mod
@@ -277,3 +458,159 @@ class TestSyncPeriodicTasks:
 
         pt.refresh_from_db()
         assert pt.start_time == original_start_time
+
+    def test_shared_schedules_are_reused(self):
+        """Tasks sharing a schedule should reuse one existing schedule row."""
+        from django_celery_beat.models import CrontabSchedule, IntervalSchedule
+
+        from django_beat_periodic.decorators import periodic_task
+        from django_beat_periodic.sync import sync_periodic_tasks
+
+        existing = IntervalSchedule.objects.create(
+            every=30, period=IntervalSchedule.SECONDS
+        )
+
+        @periodic_task(interval=timedelta(seconds=30), name="also-every-30")
+        def also_every_30_seconds():
+            return "tick"
+
+        @periodic_task(crontab={"minute": "0", "hour": "*/2"}, name="also-cron")
+        def also_every_two_hours_cron():
+            return "cron"
+
+        sync_periodic_tasks()
+
+        assert IntervalSchedule.objects.count() == 3
+        assert IntervalSchedule.objects.filter(every=30).get() == existing
+        assert CrontabSchedule.objects.count() == 2
+
+    def test_skips_when_another_process_holds_the_lock(self):
+        """Only the worker holding the sync lock should write to the DB."""
+        from django.db import connection
+        from django_celery_beat.models import PeriodicTask
+
+        from django_beat_periodic.sync import (
+            SyncStatus,
+            _sync_lock,
+            sync_periodic_tasks,
+        )
+
+        with _sync_lock(connection) as acquired:
+            assert acquired
+            assert sync_periodic_tasks() is SyncStatus.LOCKED
+
+        assert PeriodicTask.objects.count() == 0
+
+    def test_returns_synced_then_already_synced(self):
+        from django_beat_periodic.sync import SyncStatus, sync_periodic_tasks
+
+        assert sync_periodic_tasks() is SyncStatus.SYNCED
+        assert sync_periodic_tasks() is SyncStatus.ALREADY_SYNCED
+
+    def test_management_command(self):
+        from django.core.management import call_command
+        from django_celery_beat.models import PeriodicTask
+
+        out = StringIO()
+        call_command("sync_periodic_tasks", stdout=out)
+
+        assert PeriodicTask.objects.count() == 5
+        assert "Periodic tasks are synchronized." in out.getvalue()
+
+    def test_management_command_reports_lock(self):
+        from django.core.management import call_command
+        from django.db import connection
+
+        from django_beat_periodic.sync import _sync_lock
+
+        out = StringIO()
+        with _sync_lock(connection) as acquired:
+            assert acquired
+            call_command("sync_periodic_tasks", stdout=out)
+
+        assert "Another process is synchronizing" in out.getvalue()
+
+    def test_empty_registry_removes_all_managed_tasks(self):
+        """Removing every decorator should still clean up managed rows."""
+        import django_beat_periodic.sync as sync_mod
+
+        from django_celery_beat.models import PeriodicTask
+
+        from django_beat_periodic.sync import sync_periodic_tasks
+
+        sync_periodic_tasks()
+        assert PeriodicTask.objects.count() == 5
+
+        PERIODIC_TASKS.clear()
+        sync_mod._already_synced = False
+        sync_periodic_tasks()
+
+        assert PeriodicTask.objects.count() == 0
+
+    def test_query_count_does_not_grow_with_tasks(self):
+        """An unchanged re-sync should issue the same queries for any N."""
+        import django_beat_periodic.sync as sync_mod
+
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from django_beat_periodic.decorators import periodic_task
+        from django_beat_periodic.sync import sync_periodic_tasks
+
+        def resync_query_count():
+            sync_mod._already_synced = False
+            sync_periodic_tasks()
+            sync_mod._already_synced = False
+            with CaptureQueriesContext(connection) as ctx:
+                sync_periodic_tasks()
+            return len(ctx.captured_queries)
+
+        baseline = resync_query_count()
+
+        for i in range(5):
+            periodic_task(interval=60 + i, name=f"extra-interval-{i}")(lambda: None)
+            periodic_task(crontab=f"{i} 1 * * *", name=f"extra-cron-{i}")(
+                lambda: None
+            )
+
+        assert resync_query_count() == baseline
+
+
+# ------------------------------------------------------------------ #
+# Startup sync (fresh process, no connection open yet)
+# ------------------------------------------------------------------ #
+
+
+def _run_django(code, settings_module="tests.settings"):
+    """Run *code* in a fresh Python process with Django set up."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings_module}
+    return subprocess.run(
+        [sys.executable, "-c", f"import django; django.setup(); {code}"],
+        cwd=root,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def test_sync_in_fresh_process():
+    """The first connection must not re-enter the sync and deadlock."""
+    result = _run_django(
+        "from django_beat_periodic.sync import sync_periodic_tasks; "
+        "print(sync_periodic_tasks().value)",
+        settings_module="tests.settings_autosync",
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "tables_missing"
+
+
+def test_management_command_fails_without_tables():
+    result = _run_django(
+        "from django.core.management import call_command; "
+        "call_command('sync_periodic_tasks')",
+        settings_module="tests.settings_autosync",
+    )
+    assert result.returncode != 0
+    assert "run migrate first" in result.stderr
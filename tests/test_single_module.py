@@ -0,0 +1,19 @@
+"""Guard against more than one copy of the package being importable."""
+
+import importlib.util
+import os
+import sys
+
+
+def test_sync_module_resolves_to_a_single_file():
+    import django_beat_periodic.sync as sync_mod
+
+    spec = importlib.util.find_spec("django_beat_periodic.sync")
+    assert os.path.realpath(spec.origin) == os.path.realpath(sync_mod.__file__)
+
+    candidates = (
+        os.path.join(entry or os.getcwd(), "django_beat_periodic", "sync.py")
+        for entry in sys.path
+    )
+    copies = {os.path.realpath(path) for path in candidates if os.path.isfile(path)}
+    assert copies == {os.path.realpath(sync_mod.__file__)}